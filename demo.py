@@ -22,7 +22,8 @@ def run_demo():
     print("📊 Sample data file found: sample_data.csv")
     print()
     
-    # Show data preview
+    # Show data preview (parsed once and reused by both generators)
+    data = None
     try:
         import pandas as pd
         data = pd.read_csv("sample_data.csv")
@@ -49,7 +50,7 @@ def run_demo():
         from simple_report_generator import SimpleReportGenerator
         
         output_file = f"demo_simple_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        generator = SimpleReportGenerator("sample_data.csv", output_file)
+        generator = SimpleReportGenerator("sample_data.csv", output_file, data=data)
         
         if generator.generate_report():
             print(f"✅ Simple report generated: {output_file}")
@@ -74,7 +75,7 @@ def run_demo():
         from report_generator import ReportGenerator
         
         output_file = f"demo_full_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        generator = ReportGenerator("sample_data.csv", output_file)
+        generator = ReportGenerator("sample_data.csv", output_file, data=data)
         
         if generator.generate_report():
             print(f"✅ Full report generated: {output_file}")
@@ -0,0 +1,135 @@
+"""
+Report Generator Common Helpers
+Optional-dependency detection, column classification, cache keys and table styles
+shared by the full and simple report generators.
+"""
+
+import hashlib
+import mmap
+import os
+from datetime import datetime
+
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_string_dtype
+
+# Optional faster readers: pyarrow parses CSVs multithreaded, python-calamine
+# reads Excel files in Rust. Fall back to the pandas defaults when missing.
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+    PARQUET_AVAILABLE = True
+except ImportError:
+    CSV_ENGINE = 'c'
+    PARQUET_AVAILABLE = False
+
+# pandas only knows the 'calamine' engine from 2.2 on
+PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split('.')[:2])
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine' if PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Finished reports are kept here, keyed by a hash of their input data
+REPORT_CACHE_DIR = '.reportcache'
+
+# Parsed input files are kept here as Parquet, which reloads much faster than CSV/Excel
+DATA_CACHE_DIR = '.cache'
+
+_table_styles = None
+
+
+def split_columns(dtypes):
+    """Split columns into numerical and string (categorical) ones from their dtypes"""
+    # Works for both NumPy and Arrow-backed dtypes; bools are not treated as numbers,
+    # and category columns count as categorical whatever their categories hold
+    numerical = dtypes.index[[is_numeric_dtype(t) and not is_bool_dtype(t) for t in dtypes]]
+    strings = dtypes.index[[is_string_dtype(t) or isinstance(t, pd.CategoricalDtype) for t in dtypes]]
+    return numerical, strings
+
+
+def read_csv_with_fallback(file_path, engine=CSV_ENGINE, **options):
+    """Read a CSV file, retrying with the C parser if the pyarrow engine rejects it"""
+    try:
+        return pd.read_csv(file_path, engine=engine, **options)
+    except ValueError as e:  # ParserError and pyarrow's ArrowInvalid are both ValueErrors
+        if engine == 'c':
+            raise
+        # pyarrow is stricter than the C parser (e.g. about ragged rows), so a file
+        # the C parser reads must never turn into a failed report
+        print(f"Warning: {engine} could not parse the file ({e}), retrying with the C parser")
+        return pd.read_csv(file_path, engine='c', **options)
+
+
+def data_cache_path(file_path, *variant):
+    """Return the Parquet cache file for an input file loaded in a particular way"""
+    # Keyed on path, size and modification time, so an edited file gets a new entry,
+    # plus the variant (generator and read options), since each loads a different frame
+    stat = os.stat(file_path)
+    key = '|'.join(map(str, (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns) + variant))
+    return os.path.join(DATA_CACHE_DIR, f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.parquet")
+
+
+def report_cache_path(data, file_path, code_file, *variant):
+    """Return the cache file for a report, or None if its inputs cannot be fingerprinted"""
+    try:
+        # xxhash is the fastest fingerprint when installed; blake2b otherwise
+        hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+        if data is not None:
+            # hash_pandas_object only covers the values, so add the schema separately
+            hasher.update(pd.util.hash_pandas_object(data).to_numpy().tobytes())
+            hasher.update('|'.join(f"{col}:{dtype}" for col, dtype in data.dtypes.items()).encode())
+        else:
+            with open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+                    hasher.update(contents)
+        
+        # Any change to the generator code invalidates its cached reports
+        for path in (code_file, __file__):
+            with open(path, 'rb') as f:
+                hasher.update(f.read())
+        
+        # The report shows its source file name and date, so a cached copy is
+        # only reused for the same file name on the same day
+        key = '|'.join(map(str, (os.path.basename(file_path), f"{datetime.now():%Y-%m-%d}") + variant))
+        hasher.update(key.encode())
+        return os.path.join(REPORT_CACHE_DIR, f"{hasher.hexdigest()}.pdf")
+    
+    except Exception as e:
+        print(f"Warning: Report cache disabled: {e}")
+        return None
+
+
+def get_table_styles():
+    """Build the Data Overview and Sample Data table styles once and reuse them"""
+    global _table_styles
+    if _table_styles is None:
+        from reportlab.platypus import TableStyle
+        from reportlab.lib import colors
+        
+        # Grey header row over a beige, gridded body
+        header_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
+        _table_styles = {
+            'overview': TableStyle([
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10)
+            ], parent=header_style),
+            'sample': TableStyle([
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTSIZE', (0, 0), (-1, -1), 8)
+            ], parent=header_style)
+        }
+    return _table_styles
@@ -3,37 +3,254 @@ Automated Report Generator
 This script reads data from CSV/Excel files, analyzes it, and generates a formatted PDF report.
 """
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+import importlib.util
 import os
+import re
+import shutil
 from datetime import datetime
 import io
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from report_common import (
+    CSV_ENGINE, DATA_CACHE_DIR, EXCEL_ENGINE, PARQUET_AVAILABLE, REPORT_CACHE_DIR,
+    data_cache_path, get_table_styles, read_csv_with_fallback, report_cache_path, split_columns
+)
+
+# matplotlib and reportlab are imported where they are used, so importing this
+# module (or only analyzing data) does not pay for loading them
+_pyplot = None
+
+# Arrow-backed columns keep strings in contiguous buffers instead of Python objects
+READ_OPTIONS = {'dtype_backend': 'pyarrow'} if PARQUET_AVAILABLE else {}
+
+# Dtype names described as plain numerical data in the Data Overview
+NUMERICAL_DTYPES = ['int64', 'float64', 'int64[pyarrow]', 'double[pyarrow]']
+
+# Column names that are probed as dates during analysis
+DATE_COLUMN_RE = re.compile(r'date|time', re.IGNORECASE)
+
+# infer_dtype kinds (of the first DATE_PROBE_ROWS values) worth parsing as dates
+DATE_PROBE_ROWS = 100
+DATE_LIKE_KINDS = ('string', 'mixed', 'date', 'datetime', 'datetime64', 'empty')
+
+# Wide CSVs are only loaded up to this many numerical / categorical columns,
+# chosen from a probe of the first rows
+MAX_NUMERICAL_COLUMNS = 20
+MAX_CATEGORICAL_COLUMNS = 10
+COLUMN_PROBE_ROWS = 1000
+
+# Rows above this are sampled down before charting
+MAX_PLOT_ROWS = 100_000
+
+# Charts of at least this many rows are rendered in parallel worker processes;
+# below it the process start-up costs more than the rendering saves
+PARALLEL_CHART_ROWS = 50_000
+
+# Statistics reported for each numerical column, in this order
+SUMMARY_STATS = ('mean', 'median', 'std', 'min', 'max', 'sum')
+
+# The numba kernel is used for frames with more than NUMBA_MIN_COLUMNS numerical
+# columns and at least NUMBA_MIN_CELLS values; below that, compiling it (or loading
+# it from numba's cache) costs more than DataFrame.agg takes
+NUMBA_MIN_COLUMNS = 32
+NUMBA_MIN_CELLS = 50_000_000
+
+# numba and polars are optional and only imported when their path is taken
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+POLARS_AVAILABLE = importlib.util.find_spec('polars') is not None
+_column_stats = None
+
+
+def get_column_stats():
+    """Compile the numba summary-statistics kernel on first use"""
+    global _column_stats
+    if _column_stats is None:
+        from numba import njit, prange
+        
+        @njit(parallel=True, cache=True)
+        def column_stats(values):
+            """Compute SUMMARY_STATS for every column of a 2D float array, skipping NaNs"""
+            n_cols = values.shape[1]
+            out = np.empty((len(SUMMARY_STATS), n_cols))
+            for j in prange(n_cols):
+                col = values[:, j]
+                col = col[~np.isnan(col)]
+                n = col.shape[0]
+                
+                # Sum, min, max and a running mean/variance (Welford) in a single pass
+                total = 0.0
+                low = np.inf
+                high = -np.inf
+                mean = 0.0
+                m2 = 0.0
+                for i in range(n):
+                    x = col[i]
+                    total += x
+                    low = min(low, x)
+                    high = max(high, x)
+                    delta = x - mean
+                    mean += delta / (i + 1)
+                    m2 += delta * (x - mean)
+                
+                if n == 0:
+                    out[:5, j] = np.nan
+                else:
+                    out[0, j] = mean
+                    out[1, j] = np.median(col)
+                    out[2, j] = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+                    out[3, j] = low
+                    out[4, j] = high
+                out[5, j] = total
+            return out
+        
+        _column_stats = column_stats
+    return _column_stats
+
+
+def top_value_counts(counts, k):
+    """Return the k most frequent entries of unsorted value counts as a dict, most frequent first"""
+    if len(counts) > k:
+        # Partial selection of the top k instead of sorting every distinct value
+        top = np.argpartition(-counts.to_numpy(), k - 1)[:k]
+        counts = counts.iloc[np.sort(top)]
+    return counts.sort_values(ascending=False, kind='stable').to_dict()
+
+
+def polars_summary_stats(data, columns):
+    """Compute SUMMARY_STATS (one row per statistic) in one polars select, run across all cores"""
+    import polars as pl
+    
+    # Polars needs string column names, so columns are addressed by position
+    frame = pl.from_pandas(data[columns].set_axis([str(i) for i in range(len(columns))], axis=1))
+    exprs = [
+        getattr(pl.col(name), stat)().alias(f'{name}|{stat}')
+        for name in frame.columns for stat in SUMMARY_STATS
+    ]
+    # Polars reports reductions over all-null columns as None, which becomes NaN here
+    values = np.array(frame.select(exprs).row(0), dtype=np.float64)
+    return values.reshape(len(columns), len(SUMMARY_STATS)).T
+
+
+def get_pyplot():
+    """Import matplotlib.pyplot on first use, set up for off-screen rendering"""
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        
+        # Simplify long line paths and draw them in chunks to cut Agg render time
+        plt.rcParams['path.simplify'] = True
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        plt.rcParams['agg.path.chunksize'] = 10000
+        _pyplot = plt
+    return _pyplot
+
+
+def _figure_to_png():
+    """Save the current figure as PNG bytes and close it"""
+    plt = get_pyplot()
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format='png', dpi=150)
+    plt.close()
+    return buffer.getvalue()
+
+
+def render_numerical_distribution(data):
+    """Render histograms of the given numerical columns in a 2x2 grid"""
+    plt = get_pyplot()
+    axes = data.hist(bins=20, alpha=0.7, figsize=(10, 6), layout=(2, 2))
+    for ax in axes.flat:
+        if ax.get_visible():
+            col = ax.get_title()  # pandas titles each subplot with its column
+            ax.set_title(f'Distribution of {col}')
+            ax.set_xlabel(col)
+            ax.set_ylabel('Frequency')
+    
+    plt.tight_layout()
+    return _figure_to_png()
+
+
+def render_categorical_distribution(value_counts):
+    """Render a pie chart of a categorical column's value counts"""
+    plt = get_pyplot()
+    plt.figure(figsize=(10, 6))
+    plt.pie(value_counts.values, labels=value_counts.index, autopct='%1.1f%%')
+    plt.title(f'Distribution of {value_counts.index.name}')
+    plt.tight_layout()
+    return _figure_to_png()
+
+
+def render_time_series(data):
+    """Render the numerical columns against the first (date) column"""
+    plt = get_pyplot()
+    date_col = data.columns[0]
+    plt.figure(figsize=(12, 6))
+    for col in data.columns[1:]:
+        plt.plot(data[date_col], data[col], marker='o', label=col)
+    
+    plt.title('Time Series Analysis')
+    plt.xlabel('Date')
+    plt.ylabel('Values')
+    plt.legend()
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    return _figure_to_png()
+
 
 class ReportGenerator:
-    def __init__(self, data_file_path, output_path="report.pdf"):
+    # Keyword groups are tried in order, so e.g. 'sales_date' is still a date column
+    _DESC_RE = re.compile(
+        r'(?=.*?(?P<date>date|time))'
+        r'|(?=.*?(?P<id>id))'
+        r'|(?=.*?(?P<name>name))'
+        r'|(?=.*?(?P<money>sales|revenue|amount))'
+        r'|(?=.*?(?P<qty>quantity|count))'
+        r'|(?=.*?(?P<geo>region|location))',
+        re.IGNORECASE | re.DOTALL
+    )
+    _DESC_MAP = {
+        'date': "Date/time information",
+        'id': "Identifier field",
+        'name': "Name/label field",
+        'money': "Financial/sales data",
+        'qty': "Quantity/count data",
+        'geo': "Geographic information"
+    }
+    
+    def __init__(self, data_file_path, output_path="report.pdf", data=None, use_polars=False,
+                 use_cache=False):
         """
         Initialize the Report Generator
         
         Args:
             data_file_path (str): Path to the input data file (CSV or Excel)
             output_path (str): Path for the output PDF report
+            data (pd.DataFrame, optional): Already-loaded data; skips reading the file (not modified)
+            use_polars (bool): Compute summary statistics with polars (multi-core) if installed
+            use_cache (bool): Cache parsed input data in .cache/ and finished reports in .reportcache/,
+                and reuse them while the input is unchanged
         """
         self.data_file_path = data_file_path
         self.output_path = output_path
-        self.data = None
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        # A shallow copy, so parsing date columns never changes the caller's frame
+        self.data = data.copy(deep=False) if data is not None else None
+        self.use_polars = use_polars
+        self.use_cache = use_cache
+        if use_polars and not POLARS_AVAILABLE:
+            print("Warning: polars is not installed, falling back to pandas for statistics")
         
     def setup_custom_styles(self):
         """Setup custom paragraph styles for the report"""
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        
+        self.styles = getSampleStyleSheet()
+        
         # Title style
         self.title_style = ParagraphStyle(
             'CustomTitle',
@@ -64,18 +281,45 @@ class ReportGenerator:
             textColor=colors.black
         )
     
+    def data_cache_path(self):
+        """Return the Parquet cache file for the input file, or None if it cannot be cached"""
+        if not self.use_cache or not PARQUET_AVAILABLE:
+            return None
+        
+        # Column pruning and the Arrow dtype backend shape the cached frame
+        return data_cache_path(self.data_file_path, type(self).__name__, CSV_ENGINE, READ_OPTIONS,
+                               MAX_NUMERICAL_COLUMNS, MAX_CATEGORICAL_COLUMNS, COLUMN_PROBE_ROWS)
+    
     def read_data(self):
         """Read data from CSV or Excel file"""
+        if self.data is not None:
+            return True
+        
         try:
+            cache_path = self.data_cache_path()
+            if cache_path and os.path.exists(cache_path):
+                self.data = pd.read_parquet(cache_path, **READ_OPTIONS)
+                print(f"Data loaded from cache. Shape: {self.data.shape}")
+                return True
+            
             file_extension = os.path.splitext(self.data_file_path)[1].lower()
             
             if file_extension == '.csv':
-                self.data = pd.read_csv(self.data_file_path)
+                probe = pd.read_csv(self.data_file_path, nrows=COLUMN_PROBE_ROWS)
+                self.data = read_csv_with_fallback(self.data_file_path, usecols=self.select_columns(probe),
+                                                   **READ_OPTIONS)
             elif file_extension in ['.xlsx', '.xls']:
-                self.data = pd.read_excel(self.data_file_path)
+                self.data = pd.read_excel(self.data_file_path, engine=EXCEL_ENGINE, **READ_OPTIONS)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
+            if cache_path:
+                try:
+                    os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+                    self.data.to_parquet(cache_path, compression='zstd')
+                except Exception as e:
+                    print(f"Warning: Could not cache data: {e}")
+            
             print(f"Data loaded successfully. Shape: {self.data.shape}")
             return True
             
@@ -83,6 +327,20 @@ class ReportGenerator:
             print(f"Error reading data: {e}")
             return False
     
+    def select_columns(self, probe):
+        """Choose the columns to load from a sample of the data, or None to load them all"""
+        numerical_cols, categorical_cols = split_columns(probe.dtypes)
+        if len(numerical_cols) <= MAX_NUMERICAL_COLUMNS and len(categorical_cols) <= MAX_CATEGORICAL_COLUMNS:
+            return None
+        
+        # Too wide to report on every column: keep what the analysis and charts use
+        date_cols = [col for col in probe.columns if DATE_COLUMN_RE.search(str(col))][:1]
+        # Dates are still text in the probe; they must not use up a categorical slot
+        categorical_cols = categorical_cols.difference(date_cols, sort=False)
+        keep = set(numerical_cols[:MAX_NUMERICAL_COLUMNS]) | set(categorical_cols[:MAX_CATEGORICAL_COLUMNS]) | set(date_cols)
+        print(f"Wide input: loading {len(keep)} of {len(probe.columns)} columns")
+        return [col for col in probe.columns if col in keep]
+    
     def analyze_data(self):
         """Perform basic data analysis"""
         if self.data is None:
@@ -92,7 +350,7 @@ class ReportGenerator:
         analysis = {
             'total_records': len(self.data),
             'date_range': None,
-            'summary_stats': {},
+            'stats_columns': [],
             'categorical_summary': {}
         }
         
@@ -102,13 +360,21 @@ class ReportGenerator:
         
         # Date range analysis (if date column exists)
         date_columns = []
-        for col in self.data.columns:
-            if 'date' in col.lower() or 'time' in col.lower():
-                try:
-                    self.data[col] = pd.to_datetime(self.data[col])
-                    date_columns.append(col)
-                except:
-                    pass
+        date_candidates = [col for col in self.data.columns if DATE_COLUMN_RE.search(str(col))]
+        for col in date_candidates:
+            # Only fully parse columns whose leading values could be dates (e.g. not 'runtime_seconds');
+            # category columns are probed on their categories, which infer_dtype would call 'categorical'
+            values = self.data[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.cat.categories
+            sample_kind = pd.api.types.infer_dtype(values[:DATE_PROBE_ROWS], skipna=True)
+            if sample_kind not in DATE_LIKE_KINDS:
+                continue
+            # format='mixed' infers each value's format, so non-ISO dates (01/15/2024) still parse
+            parsed = pd.to_datetime(self.data[col], errors='coerce', format='mixed', cache=True)
+            if parsed.notna().any():
+                self.data[col] = parsed
+                date_columns.append(col)
         
         if date_columns:
             date_col = date_columns[0]  # Use first date column
@@ -118,27 +384,38 @@ class ReportGenerator:
                 'column': date_col
             }
         
-        # Numerical columns analysis
-        numerical_cols = self.data.select_dtypes(include=['number']).columns
-        for col in numerical_cols:
-            analysis['summary_stats'][col] = {
-                'mean': self.data[col].mean(),
-                'median': self.data[col].median(),
-                'std': self.data[col].std(),
-                'min': self.data[col].min(),
-                'max': self.data[col].max(),
-                'sum': self.data[col].sum()
-            }
+        # Classify columns once from the dtypes as they are after date parsing
+        numerical_cols, categorical_cols = split_columns(self.data.dtypes)
+        categorical_cols = categorical_cols.difference(date_columns, sort=False)  # Exclude date columns
+        
+        # Numerical columns analysis, as a SUMMARY_STATS x columns float array
+        if len(numerical_cols) == 0:
+            stats = np.empty((len(SUMMARY_STATS), 0))
+        elif self.use_polars and POLARS_AVAILABLE:
+            stats = polars_summary_stats(self.data, numerical_cols)
+        elif (NUMBA_AVAILABLE and len(numerical_cols) > NUMBA_MIN_COLUMNS
+              and len(self.data) * len(numerical_cols) >= NUMBA_MIN_CELLS):
+            # Wide frames: one fused pass per column in a compiled parallel kernel
+            values = np.asfortranarray(
+                self.data[numerical_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+            stats = get_column_stats()(values)
+        else:
+            # One vectorized pass per statistic across all columns
+            stats_df = self.data[numerical_cols].agg(list(SUMMARY_STATS))
+            stats = stats_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        analysis['stats_columns'] = list(numerical_cols)
+        analysis['stats_values'] = stats
         
         # Categorical columns analysis
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
         for col in categorical_cols:
-            if col not in date_columns:  # Exclude date columns
-                value_counts = self.data[col].value_counts()
-                analysis['categorical_summary'][col] = {
-                    'unique_values': len(value_counts),
-                    'top_values': value_counts.head(5).to_dict()
-                }
+            # One hashing pass per column gives both the distinct count and the top values
+            counts = self.data[col].value_counts(sort=False)
+            analysis['categorical_summary'][col] = {
+                'unique_values': len(counts),
+                'top_values': top_value_counts(counts, 5)
+            }
         
         self.analysis = analysis
         return analysis
@@ -150,86 +427,88 @@ class ReportGenerator:
         if self.data is None:
             return charts
         
-        try:
-            # Chart 1: Numerical data distribution (if exists)
-            numerical_cols = self.data.select_dtypes(include=['number']).columns
-            if len(numerical_cols) > 0:
-                plt.figure(figsize=(10, 6))
-                for i, col in enumerate(numerical_cols[:4]):  # Max 4 columns
-                    plt.subplot(2, 2, i+1)
-                    self.data[col].hist(bins=20, alpha=0.7)
-                    plt.title(f'Distribution of {col}')
-                    plt.xlabel(col)
-                    plt.ylabel('Frequency')
-                
-                plt.tight_layout()
-                
-                # Save directly to file instead of BytesIO
-                chart_path = os.path.abspath('temp_numerical_distribution.png')
-                plt.savefig(chart_path, format='png', dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                # Verify file was created
-                if os.path.exists(chart_path):
-                    charts.append(('numerical_distribution.png', chart_path))
-                    print(f"Created chart: {chart_path}")
-            
-            # Chart 2: Categorical data (if exists)
-            categorical_cols = self.data.select_dtypes(include=['object']).columns
-            if len(categorical_cols) > 0:
-                col = categorical_cols[0]  # Use first categorical column
-                value_counts = self.data[col].value_counts().head(10)
-                
-                plt.figure(figsize=(10, 6))
-                plt.pie(value_counts.values, labels=value_counts.index, autopct='%1.1f%%')
-                plt.title(f'Distribution of {col}')
-                
-                # Save directly to file
-                chart_path = os.path.abspath('temp_categorical_distribution.png')
-                plt.savefig(chart_path, format='png', dpi=300, bbox_inches='tight')
-                plt.close()
-                
-                # Verify file was created
-                if os.path.exists(chart_path):
-                    charts.append(('categorical_distribution.png', chart_path))
-                    print(f"Created chart: {chart_path}")
-            
-            # Chart 3: Time series (if date column exists)
-            if hasattr(self, 'analysis') and self.analysis.get('date_range'):
-                date_col = self.analysis['date_range']['column']
-                numerical_cols = self.data.select_dtypes(include=['number']).columns
-                
-                if len(numerical_cols) > 0:
-                    plt.figure(figsize=(12, 6))
-                    for col in numerical_cols[:3]:  # Max 3 lines
-                        plt.plot(self.data[date_col], self.data[col], marker='o', label=col)
-                    
-                    plt.title('Time Series Analysis')
-                    plt.xlabel('Date')
-                    plt.ylabel('Values')
-                    plt.legend()
-                    plt.xticks(rotation=45)
-                    
-                    # Save directly to file
-                    chart_path = os.path.abspath('temp_time_series.png')
-                    plt.savefig(chart_path, format='png', dpi=300, bbox_inches='tight')
-                    plt.close()
-                    
-                    # Verify file was created
-                    if os.path.exists(chart_path):
-                        charts.append(('time_series.png', chart_path))
-                        print(f"Created chart: {chart_path}")
+        # Plot a uniform row sample of large inputs; the charts look the same
+        if len(self.data) > MAX_PLOT_ROWS:
+            plot_df = self.data.sample(n=MAX_PLOT_ROWS, random_state=0).sort_index()
+        else:
+            plot_df = self.data
         
-        except Exception as e:
-            print(f"Error creating charts: {e}")
-            # Close any open figures
-            plt.close('all')
+        numerical_cols, categorical_cols = split_columns(plot_df.dtypes)
+        numerical_cols = list(numerical_cols)
+        
+        jobs = []
+        
+        # Chart 1: Numerical data distribution (if exists)
+        if numerical_cols:
+            jobs.append(('numerical_distribution.png', render_numerical_distribution,
+                         plot_df[numerical_cols[:4]]))  # Max 4 columns
+        
+        # Chart 2: Categorical data (if exists)
+        if len(categorical_cols) > 0:
+            col = categorical_cols[0]  # Use first categorical column
+            jobs.append(('categorical_distribution.png', render_categorical_distribution,
+                         plot_df[col].value_counts().head(10)))
+        
+        # Chart 3: Time series (if date column exists)
+        if hasattr(self, 'analysis') and self.analysis.get('date_range') and numerical_cols:
+            date_col = self.analysis['date_range']['column']
+            jobs.append(('time_series.png', render_time_series,
+                         plot_df[[date_col] + numerical_cols[:3]]))  # Max 3 lines
+        
+        if not jobs:
+            return charts
+        
+        if len(plot_df) >= PARALLEL_CHART_ROWS and len(jobs) > 1:
+            try:
+                # Each chart is drawn in its own process so the renders run in parallel
+                with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+                    futures = [(name, executor.submit(render, data)) for name, render, data in jobs]
+                    results = []
+                    for name, future in futures:
+                        try:
+                            results.append((name, future.result()))
+                        except (BrokenProcessPool, RuntimeError, OSError):
+                            raise
+                        except Exception as e:
+                            print(f"Error creating chart {name}: {e}")
+                for name, png in results:
+                    charts.append((name, io.BytesIO(png)))
+                    print(f"Created chart: {name}")
+                return charts
+            
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                # e.g. a script without a __main__ guard under the spawn start method
+                print(f"Warning: Parallel chart rendering failed ({e}), rendering serially")
+        
+        for name, render, data in jobs:
+            try:
+                charts.append((name, io.BytesIO(render(data))))
+                print(f"Created chart: {name}")
+            except Exception as e:
+                print(f"Error creating chart {name}: {e}")
         
         return charts
     
+    def report_cache_path(self):
+        """Return the cache file for this report, or None if caching is off or unavailable"""
+        if not self.use_cache:
+            return None
+        return report_cache_path(self.data, self.data_file_path, __file__, type(self).__name__, self.use_polars)
+    
     def generate_report(self):
         """Generate the complete PDF report"""
         try:
+            cache_path = self.report_cache_path()
+            if cache_path and os.path.exists(cache_path):
+                shutil.copyfile(cache_path, self.output_path)
+                print(f"Input data unchanged, reused cached report: {self.output_path}")
+                return True
+            
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak, Image
+            from reportlab.lib.units import inch
+            self.setup_custom_styles()  # Paragraph styles are only needed once a PDF is built
+            
             if not self.read_data():
                 return False
             
@@ -281,38 +560,29 @@ class ReportGenerator:
             story.append(Paragraph("Data Overview", self.heading_style))
             
             # Create table for column information
-            table_data = [['Column Name', 'Data Type', 'Description']]
-            for col, dtype in analysis['data_types'].items():
-                description = self.get_column_description(col, dtype)
-                table_data.append([col, str(dtype), description])
+            overview = self.describe_columns(analysis['data_types'])
+            table_data = [list(overview.columns)] + overview.to_numpy().tolist()
             
             table = Table(table_data, colWidths=[2*inch, 1.5*inch, 3*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            table.setStyle(get_table_styles()['overview'])
             
             story.append(table)
             story.append(Spacer(1, 0.3*inch))
             
             # Statistical Summary
-            if analysis['summary_stats']:
+            if analysis['stats_columns']:
                 story.append(Paragraph("Statistical Summary", self.heading_style))
                 
-                for col, stats in analysis['summary_stats'].items():
+                # Format every statistic of every column in one vectorized call
+                rendered = np.char.mod('%.2f', analysis['stats_values'])
+                for col, (mean, median, std, low, high, total) in zip(analysis['stats_columns'], rendered.T):
                     story.append(Paragraph(f"{col} Statistics:", self.subheading_style))
                     
                     stats_text = f"""
-                    Mean: {stats['mean']:.2f} | Median: {stats['median']:.2f} | 
-                    Standard Deviation: {stats['std']:.2f}<br/>
-                    Minimum: {stats['min']:.2f} | Maximum: {stats['max']:.2f} | 
-                    Total: {stats['sum']:.2f}
+                    Mean: {mean} | Median: {median} | 
+                    Standard Deviation: {std}<br/>
+                    Minimum: {low} | Maximum: {high} | 
+                    Total: {total}
                     """
                     story.append(Paragraph(stats_text, self.styles['Normal']))
                     story.append(Spacer(1, 0.1*inch))
@@ -336,24 +606,15 @@ class ReportGenerator:
             story.append(PageBreak())
             
             # Charts section
-            chart_files_to_cleanup = []
             if charts:
                 story.append(Paragraph("Data Visualizations", self.heading_style))
                 
-                for chart_name, chart_path in charts:
+                for chart_name, chart_buffer in charts:
                     try:
-                        # Verify file exists
-                        if os.path.exists(chart_path):
-                            # Add chart to story (don't delete yet)
-                            img = Image(chart_path, width=6*inch, height=3.6*inch)
-                            story.append(img)
-                            story.append(Spacer(1, 0.2*inch))
-                            print(f"Added chart to report: {chart_name}")
-                            
-                            # Track for cleanup after PDF is built
-                            chart_files_to_cleanup.append(chart_path)
-                        else:
-                            print(f"Warning: Chart file {chart_path} not found, skipping chart")
+                        img = Image(chart_buffer, width=6*inch, height=3.6*inch)
+                        story.append(img)
+                        story.append(Spacer(1, 0.2*inch))
+                        print(f"Added chart to report: {chart_name}")
                     except Exception as e:
                         print(f"Error adding chart {chart_name}: {e}")
                         continue
@@ -367,40 +628,26 @@ class ReportGenerator:
             
             # Display first 10 rows of data
             sample_data = self.data.head(10)
-            table_data = [list(sample_data.columns)]
-            
-            for _, row in sample_data.iterrows():
-                table_data.append([str(val) for val in row.values])
+            table_data = [list(sample_data.columns)] + sample_data.astype(str).to_numpy().tolist()
             
             # Calculate column widths
             num_cols = len(table_data[0])
             col_width = 6.5*inch / num_cols
             
             sample_table = Table(table_data, colWidths=[col_width] * num_cols)
-            sample_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            sample_table.setStyle(get_table_styles()['sample'])
             
             story.append(sample_table)
             
             # Build PDF
             doc.build(story)
             
-            # Clean up chart files after PDF is built
-            for chart_path in chart_files_to_cleanup:
+            if cache_path:
                 try:
-                    if os.path.exists(chart_path):
-                        os.remove(chart_path)
-                        print(f"Cleaned up: {chart_path}")
+                    os.makedirs(REPORT_CACHE_DIR, exist_ok=True)
+                    shutil.copyfile(self.output_path, cache_path)
                 except Exception as e:
-                    print(f"Warning: Could not clean up {chart_path}: {e}")
+                    print(f"Warning: Could not cache report: {e}")
             
             print(f"Report generated successfully: {self.output_path}")
             return True
@@ -408,47 +655,32 @@ class ReportGenerator:
         except Exception as e:
             print(f"Error generating report: {e}")
             return False
-        finally:
-            # Always clean up temporary files
-            self.cleanup_temp_files()
     
     def get_column_description(self, column_name, data_type):
         """Generate description for column based on name and type"""
-        col_lower = column_name.lower()
-        
-        if 'date' in col_lower or 'time' in col_lower:
-            return "Date/time information"
-        elif 'id' in col_lower:
-            return "Identifier field"
-        elif 'name' in col_lower:
-            return "Name/label field"
-        elif 'sales' in col_lower or 'revenue' in col_lower or 'amount' in col_lower:
-            return "Financial/sales data"
-        elif 'quantity' in col_lower or 'count' in col_lower:
-            return "Quantity/count data"
-        elif 'region' in col_lower or 'location' in col_lower:
-            return "Geographic information"
-        elif data_type in ['int64', 'float64']:
+        match = self._DESC_RE.match(str(column_name))
+        if match:
+            return self._DESC_MAP[match.lastgroup]
+        elif data_type in NUMERICAL_DTYPES:
             return "Numerical data"
         else:
             return "Categorical data"
     
-    def cleanup_temp_files(self):
-        """Clean up any temporary chart files"""
-        temp_files = [
-            'temp_numerical_distribution.png',
-            'temp_categorical_distribution.png',
-            'temp_time_series.png'
-        ]
-        
-        for temp_file in temp_files:
-            temp_path = os.path.abspath(temp_file)
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                    print(f"Cleaned up: {temp_path}")
-                except Exception as e:
-                    print(f"Warning: Could not remove {temp_path}: {e}")
+    def describe_columns(self, data_types):
+        """Build the Data Overview rows (name, type, description) for all columns at once"""
+        names = pd.Series([str(col) for col in data_types.keys()], dtype=object)
+        dtypes = pd.Series([str(dtype) for dtype in data_types.values()], dtype=object)
+        
+        # Each keyword family is a regex group; the first group that matched names the description
+        matched = names.str.extract(self._DESC_RE).notna()
+        descriptions = matched.idxmax(axis=1).map(self._DESC_MAP).where(matched.any(axis=1))
+        fallback = dtypes.isin(NUMERICAL_DTYPES).map({True: "Numerical data", False: "Categorical data"})
+        
+        return pd.DataFrame({
+            'Column Name': list(data_types.keys()),
+            'Data Type': dtypes,
+            'Description': descriptions.fillna(fallback)
+        })
 
 
 def main():
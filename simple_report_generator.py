@@ -3,33 +3,82 @@ Simple Automated Report Generator (No Charts Version)
 This script reads data from CSV/Excel files, analyzes it, and generates a formatted PDF report.
 """
 
+import numpy as np
 import pandas as pd
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+from report_common import (
+    CSV_ENGINE, DATA_CACHE_DIR, EXCEL_ENGINE, PARQUET_AVAILABLE, REPORT_CACHE_DIR,
+    data_cache_path, get_table_styles, read_csv_with_fallback, report_cache_path, split_columns
+)
+
+# reportlab is imported where it is used, so importing this module (e.g. when
+# main() exits early on a missing data file) does not load it
+
+# Column-name keywords and their descriptions, checked in this order
+COLUMN_KEYWORDS = {
+    'date': "Date/time information",
+    'time': "Date/time information",
+    'id': "Identifier field",
+    'name': "Name/label field",
+    'sales': "Financial/sales data",
+    'revenue': "Financial/sales data",
+    'amount': "Financial/sales data",
+    'quantity': "Quantity/count data",
+    'count': "Quantity/count data",
+    'region': "Geographic information",
+    'location': "Geographic information"
+}
+
+
+@lru_cache(maxsize=None)
+def describe_column(column_name, dtype_name):
+    """Describe a column from its name and dtype; cached for repeated schemas"""
+    col_lower = column_name.lower()
+    for keyword, description in COLUMN_KEYWORDS.items():
+        if keyword in col_lower:
+            return description
+    
+    if dtype_name in ['int64', 'float64']:
+        return "Numerical data"
+    return "Categorical data"
+
 
 class SimpleReportGenerator:
-    def __init__(self, data_file_path, output_path="simple_report.pdf"):
+    def __init__(self, data_file_path, output_path="simple_report.pdf", data=None, use_cache=False,
+                 preview_rows=None, use_category=False):
         """
         Initialize the Simple Report Generator
         
         Args:
             data_file_path (str): Path to the input data file (CSV or Excel)
             output_path (str): Path for the output PDF report
+            data (pd.DataFrame, optional): Already-loaded data; skips reading the file (not modified)
+            use_cache (bool): Cache parsed input data in .cache/ and finished reports in .reportcache/,
+                and reuse them while the input is unchanged
+            preview_rows (int, optional): Only read and report on the first N rows of the file
+            use_category (bool): Read low-cardinality text columns as category dtype (files only, not data=)
         """
         self.data_file_path = data_file_path
         self.output_path = output_path
-        self.data = None
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        # A shallow copy, so parsing date columns never changes the caller's frame
+        self.data = data.copy(deep=False) if data is not None else None
+        self.use_cache = use_cache
+        self.preview_rows = preview_rows
+        self.use_category = use_category
         
     def setup_custom_styles(self):
         """Setup custom paragraph styles for the report"""
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        
+        self.styles = getSampleStyleSheet()
+        
         # Title style
         self.title_style = ParagraphStyle(
             'CustomTitle',
@@ -60,25 +109,71 @@ class SimpleReportGenerator:
             textColor=colors.black
         )
     
+    def data_cache_path(self):
+        """Return the Parquet cache file for the input file, or None if it cannot be cached"""
+        if not self.use_cache or self.preview_rows or not PARQUET_AVAILABLE:
+            return None
+        
+        return data_cache_path(self.data_file_path, type(self).__name__, CSV_ENGINE)
+    
     def read_data(self):
         """Read data from CSV or Excel file"""
+        if self.data is not None:
+            return True
+        
         try:
+            cache_path = self.data_cache_path()
+            if cache_path and os.path.exists(cache_path):
+                self.data = pd.read_parquet(cache_path)
+                print(f"Data loaded from cache. Shape: {self.data.shape}")
+                self._convert_categories()
+                return True
+            
             file_extension = os.path.splitext(self.data_file_path)[1].lower()
             
+            # Previews stop parsing after preview_rows instead of loading the whole file
+            read_options = {'nrows': self.preview_rows} if self.preview_rows else {}
+            
             if file_extension == '.csv':
-                self.data = pd.read_csv(self.data_file_path)
+                # The pyarrow engine does not support nrows, so previews use the C parser
+                engine = 'c' if self.preview_rows else CSV_ENGINE
+                self.data = read_csv_with_fallback(self.data_file_path, engine=engine, **read_options)
             elif file_extension in ['.xlsx', '.xls']:
-                self.data = pd.read_excel(self.data_file_path)
+                self.data = pd.read_excel(self.data_file_path, engine=EXCEL_ENGINE, **read_options)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
+            if cache_path:
+                try:
+                    os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+                    self.data.to_parquet(cache_path, compression='zstd')
+                except Exception as e:
+                    print(f"Warning: Could not cache data: {e}")
+            
             print(f"Data loaded successfully. Shape: {self.data.shape}")
+            self._convert_categories()
             return True
             
         except Exception as e:
             print(f"Error reading data: {e}")
             return False
     
+    def _convert_categories(self):
+        """With use_category, store repetitive text columns of the loaded file as category dtype"""
+        if not self.use_category or not len(self.data):
+            return
+        
+        # The conversion itself finds the distinct values, so no separate nunique pass is
+        # needed; columns where at least half the values are distinct stay as they are
+        _, text_cols = split_columns(self.data.dtypes)
+        # Date/time-named columns are parsed as dates during analysis, so leave them as text
+        is_date_named = text_cols.astype(str).str.lower().str.contains('date|time', regex=True)
+        for col in text_cols[~is_date_named]:
+            converted = self.data[col].astype('category')
+            if len(converted.cat.categories) < 0.5 * len(self.data):
+                # value_counts on the integer codes then skips hashing the strings again
+                self.data[col] = converted
+    
     def analyze_data(self):
         """Perform basic data analysis"""
         if self.data is None:
@@ -89,6 +184,7 @@ class SimpleReportGenerator:
             'total_records': len(self.data),
             'date_range': None,
             'summary_stats': {},
+            'stats_df': None,
             'categorical_summary': {}
         }
         
@@ -96,67 +192,124 @@ class SimpleReportGenerator:
         analysis['columns'] = list(self.data.columns)
         analysis['data_types'] = self.data.dtypes.to_dict()
         
-        # Date range analysis (if date column exists)
-        date_columns = []
-        for col in self.data.columns:
-            if 'date' in col.lower() or 'time' in col.lower():
-                try:
-                    self.data[col] = pd.to_datetime(self.data[col])
-                    date_columns.append(col)
-                except:
-                    pass
-        
-        if date_columns:
-            date_col = date_columns[0]  # Use first date column
-            analysis['date_range'] = {
-                'start': self.data[date_col].min(),
-                'end': self.data[date_col].max(),
-                'column': date_col
-            }
+        # Date parsing changes column dtypes, so it runs before the column split below
+        date_columns, analysis['date_range'] = self._compute_dates()
+        date_set = frozenset(date_columns)  # constant-time membership checks below
         
-        # Numerical columns analysis
-        numerical_cols = self.data.select_dtypes(include=['number']).columns
-        for col in numerical_cols:
-            analysis['summary_stats'][col] = {
-                'mean': self.data[col].mean(),
-                'median': self.data[col].median(),
-                'std': self.data[col].std(),
-                'min': self.data[col].min(),
-                'max': self.data[col].max(),
-                'sum': self.data[col].sum()
-            }
+        # Classify columns once from the dtypes as they are after date parsing
+        numerical_cols, categorical_cols = split_columns(self.data.dtypes)
+        categorical_cols = [col for col in categorical_cols if col not in date_set]  # Exclude date columns
         
-        # Categorical columns analysis
-        categorical_cols = self.data.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
-            if col not in date_columns:  # Exclude date columns
-                value_counts = self.data[col].value_counts()
-                analysis['categorical_summary'][col] = {
-                    'unique_values': len(value_counts),
-                    'top_values': value_counts.head(5).to_dict()
-                }
+        # The numerical and categorical reductions are independent and spend most of
+        # their time in pandas/NumPy C code that releases the GIL, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            numeric_future = executor.submit(self._compute_numeric, numerical_cols)
+            categorical_future = executor.submit(self._compute_categorical, categorical_cols)
+            analysis['stats_df'] = numeric_future.result()
+            analysis['categorical_summary'] = categorical_future.result()
+        
+        if analysis['stats_df'] is not None:
+            analysis['summary_stats'] = analysis['stats_df'].to_dict(orient='index')
         
         self.analysis = analysis
         return analysis
     
+    def _compute_dates(self):
+        """Parse date/time columns in place; return them and the range of the first one"""
+        date_columns = []
+        is_candidate = self.data.columns.astype(str).str.lower().str.contains('date|time', regex=True)
+        for col in self.data.columns[is_candidate]:
+            # cache=True parses each distinct timestamp string only once
+            parsed = pd.to_datetime(self.data[col], errors='coerce', format='mixed', cache=True)
+            if parsed.notna().any():
+                self.data[col] = parsed
+                date_columns.append(col)
+        
+        if not date_columns:
+            return date_columns, None
+        
+        date_col = date_columns[0]  # Use first date column
+        start = self.data[date_col].min()
+        end = self.data[date_col].max()
+        return date_columns, {
+            'start': start,
+            'end': end,
+            # Formatted once here for both the executive summary and the insights
+            'start_str': start.strftime('%B %d, %Y'),
+            'end_str': end.strftime('%B %d, %Y'),
+            'column': date_col
+        }
+    
+    def _compute_numeric(self, numerical_cols):
+        """Summary statistics for each numerical column, one row per column"""
+        if len(numerical_cols) == 0:
+            return None
+        
+        # All six statistics for all columns in one vectorized call
+        return self.data[numerical_cols].agg(['mean', 'median', 'std', 'min', 'max', 'sum']).T
+    
+    def _compute_categorical(self, categorical_cols):
+        """Unique and most frequent values for each categorical column"""
+        total_records = len(self.data)
+        summary = {}
+        for col in categorical_cols:
+            # Only the five most frequent values are needed, so skip sorting every
+            # distinct value and select them with a partial sort instead
+            counts = self.data[col].value_counts(sort=False)
+            top = counts.nlargest(5)
+            summary[col] = {
+                'unique_values': len(counts),
+                'top_values': top.to_dict(),
+                # Share of all records, computed for the five values in one vectorized step
+                'top_percentages': (top / total_records * 100).to_dict()
+            }
+        return summary
+    
+    def report_cache_path(self):
+        """Return the cache file for this report, or None if caching is off or unavailable"""
+        if not self.use_cache:
+            return None
+        return report_cache_path(self.data, self.data_file_path, __file__, type(self).__name__, self.preview_rows, self.use_category)
+    
     def generate_report(self):
         """Generate the complete PDF report"""
-        if not self.read_data():
+        cache_path = self.report_cache_path()
+        if cache_path and os.path.exists(cache_path):
+            shutil.copyfile(cache_path, self.output_path)
+            print(f"Input data unchanged, reused cached report: {self.output_path}")
+            return True
+        
+        # Read the data in a worker thread; file parsing mostly releases the GIL, so the
+        # reportlab imports and the data-independent start of the document overlap it
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            read_future = executor.submit(self.read_data)
+            
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, PageBreak
+            from reportlab.lib.units import inch
+            self.setup_custom_styles()  # Paragraph styles are only needed once a PDF is built
+            
+            # Create PDF document
+            # One fixed page template and frame, set up once for the whole document
+            doc = BaseDocTemplate(self.output_path, pagesize=A4, topMargin=1*inch)
+            frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='main')
+            doc.addPageTemplates([PageTemplate(id='main', frames=[frame])])
+            story = []
+            
+            # Title
+            title = Paragraph("Automated Data Analysis Report", self.title_style)
+            story.append(title)
+            story.append(Spacer(1, 0.3*inch))
+            
+            data_loaded = read_future.result()
+        
+        if not data_loaded:
             return False
         
         analysis = self.analyze_data()
         if analysis is None:
             return False
         
-        # Create PDF document
-        doc = SimpleDocTemplate(self.output_path, pagesize=A4, topMargin=1*inch)
-        story = []
-        
-        # Title
-        title = Paragraph("Automated Data Analysis Report", self.title_style)
-        story.append(title)
-        story.append(Spacer(1, 0.3*inch))
-        
         # Report metadata
         report_date = datetime.now().strftime("%B %d, %Y")
         metadata = f"""
@@ -164,6 +317,8 @@ class SimpleReportGenerator:
         <b>Data Source:</b> {os.path.basename(self.data_file_path)}<br/>
         <b>Total Records:</b> {analysis['total_records']:,}
         """
+        if self.preview_rows:
+            metadata += f"<br/><b>Preview:</b> only the first {self.preview_rows:,} rows were read"
         story.append(Paragraph(metadata, self.styles['Normal']))
         story.append(Spacer(1, 0.3*inch))
         
@@ -178,8 +333,8 @@ class SimpleReportGenerator:
         
         if analysis['date_range']:
             date_range_text = f"""
-            <br/><br/>The data covers the period from {analysis['date_range']['start'].strftime('%B %d, %Y')} 
-            to {analysis['date_range']['end'].strftime('%B %d, %Y')}.
+            <br/><br/>The data covers the period from {analysis['date_range']['start_str']} 
+            to {analysis['date_range']['end_str']}.
             """
             summary_text += date_range_text
         
@@ -190,22 +345,13 @@ class SimpleReportGenerator:
         story.append(Paragraph("Data Overview", self.heading_style))
         
         # Create table for column information
-        table_data = [['Column Name', 'Data Type', 'Description']]
-        for col, dtype in analysis['data_types'].items():
-            description = self.get_column_description(col, dtype)
-            table_data.append([col, str(dtype), description])
+        table_data = [['Column Name', 'Data Type', 'Description']] + [
+            [col, str(dtype), self.get_column_description(col, dtype)]
+            for col, dtype in analysis['data_types'].items()
+        ]
         
         table = Table(table_data, colWidths=[2*inch, 1.5*inch, 3*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(get_table_styles()['overview'])
         
         story.append(table)
         story.append(Spacer(1, 0.3*inch))
@@ -223,8 +369,8 @@ class SimpleReportGenerator:
                 <b>Minimum:</b> {stats['min']:.2f} | <b>Maximum:</b> {stats['max']:.2f} | 
                 <b>Total:</b> {stats['sum']:.2f}
                 """
+                # No Spacer: the next subheading's spaceBefore already separates columns
                 story.append(Paragraph(stats_text, self.styles['Normal']))
-                story.append(Spacer(1, 0.1*inch))
         
         # Categorical Analysis
         if analysis['categorical_summary']:
@@ -235,7 +381,7 @@ class SimpleReportGenerator:
                 
                 cat_text = f"<b>Unique values:</b> {summary['unique_values']}<br/><br/><b>Top values:</b><br/>"
                 for value, count in summary['top_values'].items():
-                    percentage = (count / analysis['total_records']) * 100
+                    percentage = summary['top_percentages'][value]
                     cat_text += f"• <b>{value}:</b> {count} ({percentage:.1f}%)<br/>"
                 
                 story.append(Paragraph(cat_text, self.styles['Normal']))
@@ -246,27 +392,16 @@ class SimpleReportGenerator:
         story.append(Paragraph("Sample Data", self.heading_style))
         
         # Display first 10 rows of data
-        sample_data = self.data.head(10)
-        table_data = [list(sample_data.columns)]
-        
-        for _, row in sample_data.iterrows():
-            table_data.append([str(val) for val in row.values])
+        # Materialize the rows once as a row-major object array, then stringify each cell
+        sample_rows = self.data.iloc[:10].to_numpy(dtype=object)
+        table_data = [self.data.columns.tolist()] + [[str(val) for val in row] for row in sample_rows]
         
         # Calculate column widths
         num_cols = len(table_data[0])
         col_width = 6.5*inch / num_cols
         
         sample_table = Table(table_data, colWidths=[col_width] * num_cols)
-        sample_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        sample_table.setStyle(get_table_styles()['sample'])
         
         story.append(sample_table)
         
@@ -274,13 +409,21 @@ class SimpleReportGenerator:
         story.append(PageBreak())
         story.append(Paragraph("Key Insights", self.heading_style))
         
+        # All insights go in one Paragraph, so reportlab lays out a single flowable
         insights = self.generate_insights(analysis)
-        for insight in insights:
-            story.append(Paragraph(f"• {insight}", self.styles['Normal']))
-            story.append(Spacer(1, 0.1*inch))
+        insight_html = '<br/>'.join(f"• {insight}" for insight in insights)
+        story.append(Paragraph(insight_html, self.styles['Normal']))
         
         # Build PDF
         doc.build(story)
+        
+        if cache_path:
+            try:
+                os.makedirs(REPORT_CACHE_DIR, exist_ok=True)
+                shutil.copyfile(self.output_path, cache_path)
+            except Exception as e:
+                print(f"Warning: Could not cache report: {e}")
+        
         print(f"Report generated successfully: {self.output_path}")
         return True
     
@@ -297,16 +440,20 @@ class SimpleReportGenerator:
             start = analysis['date_range']['start']
             end = analysis['date_range']['end']
             days = (end - start).days
-            insights.append(f"Data spans {days} days from {start.strftime('%B %d, %Y')} to {end.strftime('%B %d, %Y')}")
-        
-        # Numerical insights
-        for col, stats in analysis['summary_stats'].items():
-            if stats['std'] > 0:
-                cv = (stats['std'] / stats['mean']) * 100
-                if cv > 50:
-                    insights.append(f"{col} shows high variability (CV: {cv:.1f}%)")
-                elif cv < 10:
-                    insights.append(f"{col} shows low variability (CV: {cv:.1f}%)")
+            insights.append(f"Data spans {days} days from {analysis['date_range']['start_str']} to {analysis['date_range']['end_str']}")
+        
+        # Numerical insights: coefficient of variation for every column at once
+        stats_df = analysis.get('stats_df')
+        if stats_df is not None:
+            std = stats_df['std'].to_numpy(dtype=float, na_value=np.nan)
+            mean = np.abs(stats_df['mean'].to_numpy(dtype=float, na_value=np.nan))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cv = np.where((mean != 0) & (std > 0), std / mean * 100, np.nan)
+            insights.extend(
+                f"{col} shows {'high' if value > 50 else 'low'} variability (CV: {value:.1f}%)"
+                for col, value in zip(stats_df.index, cv)
+                if value > 50 or value < 10  # NaN (zero mean or no spread) fails both
+            )
         
         # Categorical insights
         for col, summary in analysis['categorical_summary'].items():
@@ -314,8 +461,7 @@ class SimpleReportGenerator:
                 insights.append(f"{col} has relatively few unique values ({summary['unique_values']} categories)")
             
             top_value = list(summary['top_values'].keys())[0]
-            top_count = list(summary['top_values'].values())[0]
-            top_percentage = (top_count / analysis['total_records']) * 100
+            top_percentage = summary['top_percentages'][top_value]
             
             if top_percentage > 50:
                 insights.append(f"Most common {col} is '{top_value}' ({top_percentage:.1f}% of records)")
@@ -324,25 +470,7 @@ class SimpleReportGenerator:
     
     def get_column_description(self, column_name, data_type):
         """Generate description for column based on name and type"""
-        col_lower = column_name.lower()
-        
-        if 'date' in col_lower or 'time' in col_lower:
-            return "Date/time information"
-        elif 'id' in col_lower:
-            return "Identifier field"
-        elif 'name' in col_lower:
-            return "Name/label field"
-        elif 'sales' in col_lower or 'revenue' in col_lower or 'amount' in col_lower:
-            return "Financial/sales data"
-        elif 'quantity' in col_lower or 'count' in col_lower:
-            return "Quantity/count data"
-        elif 'region' in col_lower or 'location' in col_lower:
-            return "Geographic information"
-        elif data_type in ['int64', 'float64']:
-            return "Numerical data"
-        else:
-            return "Categorical data"
-
+        return describe_column(str(column_name), str(data_type))
 
 def main():
     """Main function to run the simple report generator"""